@@ -5,6 +5,7 @@ Loads configuration from TOML file with proper validation and empty string handl
 
 import tomllib
 import logging
+import functools
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
@@ -16,8 +17,24 @@ RECEIPT_WIDTH = 48  # Standard for 80mm thermal printers
 RECEIPT_PADDING = 2  # Console preview padding
 RECEIPT_INNER_WIDTH = RECEIPT_WIDTH - (RECEIPT_PADDING * 2)
 
+# Config file locations, in the lookup order documented in load_config
+_REPO_DEFAULT = Path("papercut.toml")
+_USER_CONFIG_DIRS = ("/config", "./config")
+_USER_CONFIG_FILES = tuple(
+    Path(config_dir, "papercut.toml") for config_dir in _USER_CONFIG_DIRS
+)
 
-@dataclass
+# Logo file names in order of preference (formats supported by ESC/POS printers)
+_LOGO_FILENAMES = ("logo.png", "logo.jpg", "logo.gif", "logo.bmp")
+
+# Keys that must be present after merging; provider sections validate their own
+_REQUIRED_KEYS = {
+    "printer": ("usb_vendor_id", "usb_product_id", "profile"),
+    "footer": ("disabled", "qr_code_disabled", "qr_code_size"),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class PrinterConfig:
     """USB printer configuration."""
 
@@ -26,7 +43,7 @@ class PrinterConfig:
     profile: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HeaderConfig:
     """Receipt header configuration."""
 
@@ -39,7 +56,7 @@ class HeaderConfig:
     url: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FooterConfig:
     """Receipt footer configuration."""
 
@@ -50,14 +67,14 @@ class FooterConfig:
     footer_text: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProvidersConfig:
     """Providers configuration - dynamically populated by provider modules."""
 
     linear: Optional[object] = None  # Will be LinearProviderConfig from provider module
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Main configuration object."""
 
@@ -75,11 +92,87 @@ def _deep_merge(base: dict, overlay: dict) -> None:
         base: Base dictionary to merge into
         overlay: Overlay dictionary with values to merge
     """
-    for key, value in overlay.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            _deep_merge(base[key], value)
-        else:
-            base[key] = value
+    # Walk nested tables with an explicit stack instead of recursing.
+    # tomllib only produces plain dicts, so exact type checks are enough.
+    stack = [(base, overlay)]
+    while stack:
+        base_table, overlay_table = stack.pop()
+        for key, value in overlay_table.items():
+            base_value = base_table.get(key)
+            if type(value) is dict and type(base_value) is dict:
+                stack.append((base_value, value))
+            else:
+                base_table[key] = value
+
+
+def _parse_usb_id(value: int | str) -> int:
+    """
+    Parse a USB vendor/product ID from config.
+
+    Args:
+        value: ID as a hex string (e.g. "0x04b8") or an integer
+
+    Returns:
+        ID as an integer
+
+    Raises:
+        ValueError: If the value is not a valid 16-bit USB ID
+    """
+    if isinstance(value, str):
+        try:
+            usb_id = int(value, 16)
+        except ValueError:
+            usb_id = None
+    # bool is an int subclass, but `true` is not a USB ID
+    elif isinstance(value, int) and not isinstance(value, bool):
+        usb_id = value
+    else:
+        usb_id = None
+    if usb_id is None or not 0 <= usb_id <= 0xFFFF:
+        raise ValueError(
+            f"USB ID must be a 16-bit integer or hex string, got {value!r}"
+        )
+    return usb_id
+
+
+def _check_required_keys(toml_data: dict) -> None:
+    """
+    Check that all required config keys are present.
+
+    Args:
+        toml_data: Merged TOML dictionary
+
+    Raises:
+        ValueError: If any required key is missing, listing all of them
+    """
+    missing = [
+        f"[{section}] {key}"
+        for section, keys in _REQUIRED_KEYS.items()
+        for key in keys
+        if key not in toml_data.get(section, {})
+    ]
+    if missing:
+        raise ValueError(
+            "Missing required config fields:\n"
+            + "\n".join(f"  {field}" for field in missing)
+        )
+
+
+def _find_logo(config_dir: str) -> Optional[str]:
+    """
+    Find the logo in a config directory.
+
+    Args:
+        config_dir: Config directory path
+
+    Returns:
+        Path to the first supported logo file, or None if there is none
+    """
+    for filename in _LOGO_FILENAMES:
+        logo_path = Path(config_dir, filename)
+        if logo_path.is_file():
+            return str(logo_path)
+    return None
 
 
 def load_config() -> Config:
@@ -100,59 +193,47 @@ def load_config() -> Config:
         tomllib.TOMLDecodeError: If TOML file is malformed
     """
     # Load repo default first (always exists)
-    repo_default = Path("papercut.toml")
-    if not repo_default.exists():
-        raise FileNotFoundError(
-            "Repo default config 'papercut.toml' not found. This file should always exist in the repo."
-        )
-
     try:
-        with open(repo_default, "rb") as f:
+        with open(_REPO_DEFAULT, "rb") as f:
             toml_data = tomllib.load(f)
-        config_file_path = repo_default
+        config_file_path = _REPO_DEFAULT
+    except FileNotFoundError as e:
+        raise FileNotFoundError(
+            "Repo default config 'papercut.toml' not found. This file should always exist in the repo."
+        ) from e
     except tomllib.TOMLDecodeError as e:
         raise ValueError(
-            f"Failed to parse repo default config {repo_default}: {e}"
+            f"Failed to parse repo default config {_REPO_DEFAULT}: {e}"
         ) from e
 
     # Try to overlay user config (optional)
-    user_config_paths = [
-        Path("/config/papercut.toml"),
-        Path("./config/papercut.toml"),
-    ]
-
-    for user_path in user_config_paths:
-        if user_path.exists():
+    for user_path in _USER_CONFIG_FILES:
+        if user_path.is_file():
             try:
                 with open(user_path, "rb") as f:
                     user_data = tomllib.load(f)
                 # Deep merge user config over defaults
                 _deep_merge(toml_data, user_data)
-                config_file_path = f"{repo_default} + {user_path}"
+                config_file_path = f"{_REPO_DEFAULT} + {user_path}"
                 break
             except tomllib.TOMLDecodeError as e:
                 raise ValueError(
                     f"Failed to parse user config file {user_path}: {e}"
                 ) from e
 
+    _check_required_keys(toml_data)
+
     # Parse printer config (convert hex strings to integers)
-    printer_data = toml_data.get("printer", {})
+    printer_data = toml_data["printer"]
     try:
-        vendor_id_str = printer_data["usb_vendor_id"]
-        product_id_str = printer_data["usb_product_id"]
-        profile = printer_data["profile"]
         printer = PrinterConfig(
-            usb_vendor_id=int(vendor_id_str, 16)
-            if isinstance(vendor_id_str, str)
-            else vendor_id_str,
-            usb_product_id=int(product_id_str, 16)
-            if isinstance(product_id_str, str)
-            else product_id_str,
-            profile=profile,
+            usb_vendor_id=_parse_usb_id(printer_data["usb_vendor_id"]),
+            usb_product_id=_parse_usb_id(printer_data["usb_product_id"]),
+            profile=printer_data["profile"],
         )
-    except (KeyError, ValueError) as e:
+    except ValueError as e:
         raise ValueError(
-            f"Invalid or missing USB printer config. Check [printer] section in config file: {e}"
+            f"Invalid USB printer config. Check [printer] section in config file: {e}"
         ) from e
 
     # Parse and normalize header (empty strings → None)
@@ -163,24 +244,12 @@ def load_config() -> Config:
     logo_disabled = header_data.get("logo_disabled", False)
     resolved_logo_path = None
     if not logo_disabled:
-        # Supported image formats for ESC/POS printers
-        supported_extensions = [".png", ".jpg", ".gif", ".bmp"]
-
-        # Prefer absolute path first
-        for ext in supported_extensions:
-            absolute_logo = Path(f"/config/logo{ext}")
-            if absolute_logo.exists():
-                resolved_logo_path = str(absolute_logo)
+        # Prefer absolute path first, fall back to relative path if not found
+        for config_dir in _USER_CONFIG_DIRS:
+            resolved_logo_path = _find_logo(config_dir)
+            if resolved_logo_path is not None:
                 break
 
-        # Fall back to relative path if not found
-        if resolved_logo_path is None:
-            for ext in supported_extensions:
-                relative_logo = Path(f"./config/logo{ext}")
-                if relative_logo.exists():
-                    resolved_logo_path = str(relative_logo)
-                    break
-
     header = HeaderConfig(
         logo_disabled=logo_disabled,
         logo_path=resolved_logo_path,
@@ -192,7 +261,7 @@ def load_config() -> Config:
     )
 
     # Parse and normalize footer (empty strings → None for text fields)
-    footer_data = toml_data.get("footer", {})
+    footer_data = toml_data["footer"]
     footer = FooterConfig(
         disabled=footer_data["disabled"],
         qr_code_disabled=footer_data["qr_code_disabled"],
@@ -202,23 +271,28 @@ def load_config() -> Config:
     )
 
     # Load provider configs dynamically from their modules
-    providers = ProvidersConfig()
+    linear_config = None
 
-    # Linear provider (if available)
+    # Linear provider (if installed/available)
     try:
         from papercut.platforms.linear import (
             load_config_from_toml as load_linear_config,
         )
-
-        providers.linear = load_linear_config(toml_data)
-    except ImportError:
-        # Linear provider not installed/available
-        pass
-    except ValueError as e:
-        # Linear config validation failed
-        raise ValueError(
-            f"Linear provider config error (from {config_file_path}):\n{e}"
-        ) from e
+    except ModuleNotFoundError as e:
+        # Only a missing provider package is expected; import errors raised
+        # from inside an installed provider still surface
+        if e.name != "papercut.platforms.linear":
+            raise
+    else:
+        try:
+            linear_config = load_linear_config(toml_data)
+        except ValueError as e:
+            # Linear config validation failed
+            raise ValueError(
+                f"Linear provider config error (from {config_file_path}):\n{e}"
+            ) from e
+
+    providers = ProvidersConfig(linear=linear_config)
 
     # Create config object
     config = Config(
@@ -228,45 +302,71 @@ def load_config() -> Config:
         providers=providers,
     )
 
-    # Log final merged configuration
-    logger.info("=" * 60)
-    logger.info(f"Config source: {config_file_path}")
-    logger.info("=" * 60)
-    logger.info("")
-    logger.info("[printer]")
-    logger.info(f"  usb_vendor_id = {hex(config.printer.usb_vendor_id)}")
-    logger.info(f"  usb_product_id = {hex(config.printer.usb_product_id)}")
-    logger.info(f"  profile = {config.printer.profile}")
-    logger.info("")
-    logger.info("[header]")
-    logger.info(f"  logo_disabled = {config.header.logo_disabled}")
-    logger.info(f"  company_name = {config.header.company_name}")
-    logger.info(f"  address_line1 = {config.header.address_line1}")
-    logger.info(f"  address_line2 = {config.header.address_line2}")
-    logger.info(f"  phone = {config.header.phone}")
-    logger.info(f"  url = {config.header.url}")
-    logger.info("")
-    logger.info("[footer]")
-    logger.info(f"  disabled = {config.footer.disabled}")
-    logger.info(f"  qr_code_disabled = {config.footer.qr_code_disabled}")
-    logger.info(f"  qr_code_size = {config.footer.qr_code_size}")
-    logger.info(f"  qr_code_title = {config.footer.qr_code_title}")
-    logger.info(f"  footer_text = {config.footer.footer_text}")
-    logger.info("")
-    if config.providers.linear:
-        logger.info("[providers.linear]")
-        logger.info(f"  disabled = {config.providers.linear.disabled}")
-        logger.info(
-            f"  signing_secret = {'***' if config.providers.linear.signing_secret else None}"
-        )
-        logger.info(f"  max_title_length = {config.providers.linear.max_title_length}")
-        logger.info(
-            f"  max_description_length = {config.providers.linear.max_description_length}"
-        )
-    logger.info("=" * 60)
+    # Log final merged configuration as a single record
+    if logger.isEnabledFor(logging.INFO):
+        rule = "=" * 60
+        lines = [
+            rule,
+            f"Config source: {config_file_path}",
+            rule,
+            "",
+            "[printer]",
+            f"  usb_vendor_id = {hex(config.printer.usb_vendor_id)}",
+            f"  usb_product_id = {hex(config.printer.usb_product_id)}",
+            f"  profile = {config.printer.profile}",
+            "",
+            "[header]",
+            f"  logo_disabled = {config.header.logo_disabled}",
+            f"  company_name = {config.header.company_name}",
+            f"  address_line1 = {config.header.address_line1}",
+            f"  address_line2 = {config.header.address_line2}",
+            f"  phone = {config.header.phone}",
+            f"  url = {config.header.url}",
+            "",
+            "[footer]",
+            f"  disabled = {config.footer.disabled}",
+            f"  qr_code_disabled = {config.footer.qr_code_disabled}",
+            f"  qr_code_size = {config.footer.qr_code_size}",
+            f"  qr_code_title = {config.footer.qr_code_title}",
+            f"  footer_text = {config.footer.footer_text}",
+            "",
+        ]
+        if config.providers.linear:
+            linear = config.providers.linear
+            lines += [
+                "[providers.linear]",
+                f"  disabled = {linear.disabled}",
+                f"  signing_secret = {'***' if linear.signing_secret else None}",
+                f"  max_title_length = {linear.max_title_length}",
+                f"  max_description_length = {linear.max_description_length}",
+            ]
+        lines.append(rule)
+        logger.info("\n%s", "\n".join(lines))
 
     return config
 
 
-# Load config on module import
-config = load_config()
+@functools.cache
+def get_config() -> Config:
+    """
+    Get the configuration, loading it on first use.
+
+    Config files are read once per process; restart Papercut to pick up
+    changes to them.
+
+    Returns:
+        Config: Validated configuration object
+    """
+    return load_config()
+
+
+def __getattr__(name: str):
+    """
+    Resolve the module-level `config` lazily (PEP 562).
+
+    `from config import config` keeps working, but the config files are only
+    read on first access rather than whenever this module is imported.
+    """
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,7 @@ from fastapi import FastAPI
 from pydantic import BaseModel, Field
 
 from papercut.logging_config import setup_logging
-from config import config
+from config import get_config
 
 setup_logging()
 
@@ -26,7 +26,8 @@ class HealthCheckResponse(BaseModel):
 
 
 # Dynamically include platform routers (only if enabled)
-if config.providers.linear and not config.providers.linear.disabled:
+linear_config = get_config().providers.linear
+if linear_config and not linear_config.disabled:
     from papercut.platforms.linear.router import router as linear_router
 
     app.include_router(linear_router, prefix="/webhooks")
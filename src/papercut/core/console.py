@@ -3,41 +3,126 @@ Console receipt preview.
 Formats tickets as ASCII receipts for console logging.
 """
 
+import re
+import sys
+import functools
+
 from papercut.core.models import Ticket
-from papercut.core.utils import wrap_text, truncate_text, utc_to_local
+from papercut.core.utils import (
+    TIMESTAMP_FORMAT,
+    DATE_FORMAT,
+    format_date,
+    wrap_text,
+    truncate_text,
+    utc_to_local,
+)
 from config import (
-    config,
+    get_config,
     RECEIPT_WIDTH,
     RECEIPT_PADDING,
     RECEIPT_INNER_WIDTH,
 )
 
+# Receipt width is fixed, so the static pieces are built once at import
+_TOP_BORDER = "┌" + "─" * RECEIPT_WIDTH + "┐"
+_BOTTOM_BORDER = "└" + "─" * RECEIPT_WIDTH + "┘"
+_BLANK_LINE = "│" + " " * RECEIPT_WIDTH + "│"
+_PAD = " " * RECEIPT_PADDING
 
-def _print_border_line(width: int = None, style: str = "top") -> None:
-    """Print a border line for the receipt."""
-    if width is None:
-        width = RECEIPT_WIDTH
-    if style == "top":
-        print("┌" + "─" * width + "┐")
-    elif style == "bottom":
-        print("└" + "─" * width + "┘")
+
+# Wrappable chunks of a column value: words, with a break allowed after commas
+_WRAP_TOKEN = re.compile(r"[^\s,]*,|[^\s,]+")
 
 
-def _print_line(content: str, width: int = None) -> None:
-    """Print a line with borders on both sides."""
+def _wrap_value(value: str, width: int) -> list[str]:
+    """
+    Wrap a column value in a single forward pass over its words.
+
+    Lines break at whitespace or right after a comma, and each finished line
+    is sliced out of the original string. Words longer than the column are
+    force-broken at the column width.
+    """
+    lines = []
+    line_start = line_end = None
+    for token in _WRAP_TOKEN.finditer(value):
+        start, end = token.span()
+        if line_start is not None:
+            if end - line_start <= width:
+                line_end = end
+                continue
+            lines.append(value[line_start:line_end])
+        # Force break words that are too long for a line of their own
+        while end - start > width:
+            lines.append(value[start : start + width])
+            start += width
+        line_start, line_end = start, end
+    if line_start is not None:
+        lines.append(value[line_start:line_end])
+    return lines
+
+
+def _line(content: str, width: int = None) -> str:
+    """Format a line with borders on both sides, padded or cut to width."""
     if width is None:
         width = RECEIPT_WIDTH
-    if len(content) < width:
-        content = content + " " * (width - len(content))
-    elif len(content) > width:
-        content = content[:width]
-    print("│" + content + "│")
+    return f"│{content:<{width}.{width}}│"
+
+
+def _framed(content: str) -> str:
+    """Add side borders to content that is already exactly receipt width."""
+    return "│" + content + "│"
+
+
+def _centered(text: str) -> str:
+    """Format a bordered line with text centered between the side padding."""
+    return _line(f"{_PAD}{text:^{RECEIPT_INNER_WIDTH}}{_PAD}")
+
+
+@functools.cache
+def _header_lines() -> tuple[str, ...]:
+    """Format the company header block, which only depends on config."""
+    header = get_config().header
+    phone = f"Tel: {header.phone}" if header.phone is not None else None
+    return tuple(
+        _centered(text)
+        for text in (
+            header.company_name,
+            header.address_line1,
+            header.address_line2,
+            phone,
+            header.url,
+        )
+        if text is not None
+    )
+
+
+@functools.cache
+def _footer_lines() -> tuple[str, ...]:
+    """Format the footer block, which only depends on config."""
+    footer = get_config().footer
+    if footer.disabled:
+        return ()
+
+    lines = []
+    if footer.qr_code_title is not None:
+        lines.append(_line(f"{footer.qr_code_title:^{RECEIPT_INNER_WIDTH}}"))
+        lines.append(_BLANK_LINE)
+
+    if not footer.qr_code_disabled:
+        lines.append(_line(f"{'QR CODE HERE':^{RECEIPT_INNER_WIDTH}}"))
+        lines.append(_BLANK_LINE)
+
+    if footer.footer_text is not None:
+        lines.append(_centered(footer.footer_text))
+        lines.append(_BLANK_LINE)
+
+    return tuple(lines)
 
 
 def _wrap_two_column(
     label: str, value: str, width: int = None, padding: int = None
-) -> None:
-    """Print text in two-column format with wrapping."""
+) -> list[str]:
+    """Format text in two-column format with wrapping."""
     if width is None:
         width = RECEIPT_WIDTH
     if padding is None:
@@ -46,32 +131,28 @@ def _wrap_two_column(
     usable_width = width - (padding * 2)
     max_col_width = int(usable_width * 0.45)
 
-    # Wrap right column (value) if needed
-    value_lines = []
-    current_value = value
-    while len(current_value) > max_col_width:
-        split_at = max(
-            current_value[:max_col_width].rfind(" "),
-            current_value[:max_col_width].rfind(",") + 1,
-        )
-        if split_at <= 0:
-            split_at = max_col_width
-        value_lines.append(current_value[:split_at].rstrip())
-        current_value = current_value[split_at:].lstrip()
-    if current_value:
-        value_lines.append(current_value)
-
-    # Print first line: label left-aligned, value right-aligned
+    if len(value) <= max_col_width:
+        # Most values (ID, team, status...) fit on one line: skip the wrap scan
+        value_lines = [value] if value else []
+    else:
+        value_lines = _wrap_value(value, max_col_width)
+
+    lines = []
+
+    pad = " " * padding
+
+    # Value lines never exceed the column width, so rows built here already
+    # span the full width and only need their borders
+    # First line: label left-aligned, value right-aligned
     if value_lines:
-        gap = usable_width - len(label) - len(value_lines[0])
-        content = " " * padding + label + " " * gap + value_lines[0] + " " * padding
-        _print_line(content, width)
+        value_width = usable_width - len(label)
+        lines.append(_framed(f"{pad}{label}{value_lines[0]:>{value_width}}{pad}"))
 
-    # Print remaining value lines
+    # Remaining value lines
     for value_line in value_lines[1:]:
-        gap = usable_width - len(value_line)
-        content = " " * padding + " " * gap + value_line + " " * padding
-        _print_line(content, width)
+        lines.append(_framed(f"{pad}{value_line:>{usable_width}}{pad}"))
+
+    return lines
 
 
 def print_console_preview(ticket: Ticket) -> None:
@@ -83,115 +164,57 @@ def print_console_preview(ticket: Ticket) -> None:
         ticket: Platform-agnostic ticket to display
     """
     width = RECEIPT_WIDTH
-    padding = RECEIPT_PADDING
     inner_width = RECEIPT_INNER_WIDTH
+    linear = get_config().providers.linear
 
-    print("\n")
-    _print_border_line(width, "top")
-    _print_line("", width)
-
-    # Company header
-    if config.header.company_name is not None:
-        _print_line(
-            " " * padding
-            + config.header.company_name.center(inner_width)
-            + " " * padding,
-            width,
-        )
-
-    # Company address
-    if config.header.address_line1 is not None:
-        _print_line(
-            " " * padding
-            + config.header.address_line1.center(inner_width)
-            + " " * padding,
-            width,
-        )
-    if config.header.address_line2 is not None:
-        _print_line(
-            " " * padding
-            + config.header.address_line2.center(inner_width)
-            + " " * padding,
-            width,
-        )
-
-    if config.header.phone is not None:
-        _print_line(
-            " " * padding
-            + f"Tel: {config.header.phone}".center(inner_width)
-            + " " * padding,
-            width,
-        )
-
-    if config.header.url is not None:
-        _print_line(
-            " " * padding + config.header.url.center(inner_width) + " " * padding, width
-        )
-
-    _print_line("", width)
+    lines = [_TOP_BORDER, _BLANK_LINE, *_header_lines(), _BLANK_LINE]
 
     # Timestamp
     local_time = utc_to_local(ticket.created_at)
-    created_at = local_time.strftime("%b %d, %Y at %I:%M %p").center(inner_width)
-    _print_line(" " * padding + created_at + " " * padding, width)
-    _print_line("", width)
+    lines.append(_centered(format_date(local_time, TIMESTAMP_FORMAT)))
+    lines.append(_BLANK_LINE)
 
     # Details in two-column format
-    _wrap_two_column("ID", ticket.identifier, width)
-    _wrap_two_column("Team", ticket.team, width)
-    _wrap_two_column("Priority", ticket.priority, width)
-    _wrap_two_column("Status", ticket.status, width)
+    lines.extend(_wrap_two_column("ID", ticket.identifier, width))
+    lines.extend(_wrap_two_column("Team", ticket.team, width))
+    lines.extend(_wrap_two_column("Priority", ticket.priority, width))
+    lines.extend(_wrap_two_column("Status", ticket.status, width))
 
     if ticket.assignee:
-        _wrap_two_column("Assignee", ticket.assignee, width)
+        lines.extend(_wrap_two_column("Assignee", ticket.assignee, width))
 
     if ticket.due_date:
-        due = ticket.due_date.strftime("%b %d, %Y")
-        _wrap_two_column("Due", due, width)
+        due = format_date(ticket.due_date, DATE_FORMAT)
+        lines.extend(_wrap_two_column("Due", due, width))
 
-    _wrap_two_column("Creator", ticket.created_by, width)
+    lines.extend(_wrap_two_column("Creator", ticket.created_by, width))
 
     if ticket.labels:
         label_names = ", ".join(ticket.labels)
-        _wrap_two_column("Labels", label_names, width)
+        lines.extend(_wrap_two_column("Labels", label_names, width))
 
-    _print_line("", width)
+    lines.append(_BLANK_LINE)
 
     # Ticket title (wrapped)
-    title = truncate_text(ticket.title, config.providers.linear.max_title_length)
+    title = truncate_text(ticket.title, linear.max_title_length)
     title_lines = wrap_text(title, inner_width)
     for line in title_lines:
-        _print_line(" " * padding + line + " " * padding, width)
-    _print_line("", width)
+        lines.append(_line(f"{_PAD}{line}", width))
+    lines.append(_BLANK_LINE)
 
     # Ticket description (wrapped)
     if ticket.description:
-        desc = truncate_text(
-            ticket.description, config.providers.linear.max_description_length
-        )
+        desc = truncate_text(ticket.description, linear.max_description_length)
         desc_lines = wrap_text(desc, inner_width)
         for line in desc_lines:
-            _print_line(" " * padding + line + " " * padding, width)
-        _print_line("", width)
+            lines.append(_line(f"{_PAD}{line}", width))
+        lines.append(_BLANK_LINE)
 
     # Footer section
-    if not config.footer.disabled:
-        if config.footer.qr_code_title is not None:
-            _print_line(config.footer.qr_code_title.center(inner_width), width)
-            _print_line("", width)
-
-        if not config.footer.qr_code_disabled:
-            _print_line("QR CODE HERE".center(inner_width), width)
-            _print_line("", width)
-
-        if config.footer.footer_text is not None:
-            _print_line(
-                " " * padding
-                + config.footer.footer_text.center(inner_width)
-                + " " * padding,
-                width,
-            )
-            _print_line("", width)
-
-    _print_border_line(width, "bottom")
-    print()
+    lines.extend(_footer_lines())
+    lines.append(_BOTTOM_BORDER)
+
+    # Emit the whole receipt in a single write instead of one print() per line,
+    # and flush so it isn't split or held back when stdout is a buffered pipe
+    sys.stdout.write("\n\n" + "\n".join(lines) + "\n\n")
+    sys.stdout.flush()
@@ -3,11 +3,35 @@ Markdown renderer for receipt printers.
 Converts markdown text to formatted receipt output using python-escpos.
 """
 
+import functools
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# Inline formatting: **bold** and *italic* (with word boundaries for italic)
+# Bold: **text**
+# Italic: *text* (but not mid-word like *something* in the middle)
+_INLINE_FORMAT_RE = re.compile(r"(\*\*([^*]+?)\*\*)|(?<!\w)(\*([^*]+?)\*)(?!\w)")
+
+# Inline markdown stripped from headers
+_BOLD_RE = re.compile(r"\*\*([^*]+?)\*\*")
+_ITALIC_RE = re.compile(r"(?<!\*)\*([^*]+?)\*(?!\*)")
+_CODE_RE = re.compile(r"`([^`]+?)`")
+_LINK_RE = re.compile(r"\[([^\]]+?)\]\([^)]+?\)")
+
+# Splits text on whitespace runs, keeping the whitespace as tokens
+_WHITESPACE_SPLIT_RE = re.compile(r"(\s+)")
+
+# Characters that can start any supported markdown construct
+_MARKDOWN_SYNTAX_RE = re.compile(r"[#*-]")
+
+# Inline segment types
+_NORMAL, _BOLD, _ITALIC = 0, 1, 2
+
+# Bullet list markers (must be followed by a space)
+_BULLET_MARKERS = ("* ", "- ")
+
 
 def render_markdown_to_receipt(printer, markdown_text: str) -> None:
     """
@@ -31,12 +55,18 @@ def render_markdown_to_receipt(printer, markdown_text: str) -> None:
     lines = markdown_text.split("\n")
     columns = printer.profile.get_columns(font="a")
 
+    # Plain-text descriptions (the common case) skip the header, bullet and
+    # inline checks; lines are still printed one by one to keep line breaks
+    plain = _MARKDOWN_SYNTAX_RE.search(markdown_text) is None
+
     # Track consecutive blank lines to reduce them
     consecutive_blanks = 0
 
     for line in lines:
+        stripped = line.strip()
+
         # Detect blank lines
-        if line.strip() == "":
+        if not stripped:
             consecutive_blanks += 1
             continue
 
@@ -53,18 +83,24 @@ def render_markdown_to_receipt(printer, markdown_text: str) -> None:
                 printer.ln(blanks_to_print)
             consecutive_blanks = 0
 
-        # Detect headers (must be at line start)
-        if line.startswith("# ") and not line.startswith("## "):
+        if plain:
+            printer.block_text(line, columns=columns)
+            printer.ln()
+            continue
+
+        # Detect headers (must be at line start); each prefix excludes the
+        # longer ones, since the character after the hashes must be a space
+        if line.startswith("# "):
             _render_h1(printer, line[2:], columns)
-        elif line.startswith("## ") and not line.startswith("### "):
+        elif line.startswith("## "):
             _render_h2(printer, line[3:], columns)
         elif line.startswith("### "):
             # H3, H4, H5, H6 all get same treatment
             header_text = line.lstrip("#").strip()
             _render_h3_plus(printer, header_text, columns)
         # Detect bullet lists (with space after marker)
-        elif line.strip().startswith(("* ", "- ")) and len(line.strip()) > 2:
-            _render_bullet(printer, line.strip()[2:], columns)
+        elif stripped.startswith(_BULLET_MARKERS) and len(stripped) > 2:
+            _render_bullet(printer, stripped[2:], columns)
         # Everything else: raw markdown
         else:
             _render_text(printer, line, columns)
@@ -81,7 +117,7 @@ def _render_h1(printer, text: str, columns: int) -> None:
     printer.set(bold=True, double_width=True, double_height=True)
     # Half columns because double_width makes each char 2x wide
     printer.block_text(clean_text, columns=columns // 2)
-    printer.set_with_default()
+    printer.set(bold=False, normal_textsize=True)
     printer.ln()
 
 
@@ -95,7 +131,7 @@ def _render_h2(printer, text: str, columns: int) -> None:
     clean_text = _strip_inline_markdown(text)
     printer.set(bold=True, double_height=True)
     printer.block_text(clean_text, columns=columns)
-    printer.set_with_default()
+    printer.set(bold=False, normal_textsize=True)
     printer.ln()
 
 
@@ -109,7 +145,7 @@ def _render_h3_plus(printer, text: str, columns: int) -> None:
     clean_text = _strip_inline_markdown(text)
     printer.set(bold=True)
     printer.block_text(clean_text, columns=columns)
-    printer.set_with_default()
+    printer.set(bold=False)
     printer.ln()
 
 
@@ -137,11 +173,17 @@ def _render_text_with_inline_formatting(printer, text: str, columns: int) -> Non
 
     Other markdown (links, images, etc.) prints as-is.
     """
+    # Bold and italic both need a "*", so most lines skip parsing entirely
+    if "*" not in text:
+        printer.block_text(text, columns=columns)
+        printer.ln()
+        return
+
     # Parse inline formatting and split into segments
     segments = _parse_inline_formatting(text)
 
     # If no formatting, use block_text for efficient wrapping
-    if all(seg["type"] == "normal" for seg in segments):
+    if all(seg_type == _NORMAL for seg_type, _ in segments):
         printer.block_text(text, columns=columns)
         printer.ln()
     else:
@@ -149,7 +191,9 @@ def _render_text_with_inline_formatting(printer, text: str, columns: int) -> Non
         _render_segments_with_wrapping(printer, segments, columns)
 
 
-def _render_segments_with_wrapping(printer, segments: list, columns: int) -> None:
+def _render_segments_with_wrapping(
+    printer, segments: tuple[tuple[int, str], ...], columns: int
+) -> None:
     """
     Render formatted segments with proper word wrapping.
 
@@ -159,23 +203,17 @@ def _render_segments_with_wrapping(printer, segments: list, columns: int) -> Non
 
     Args:
         printer: ESC/POS printer instance
-        segments: List of {'type': 'normal'|'bold'|'italic', 'content': 'text'}
+        segments: Tuple of (type, content) pairs, type is _NORMAL|_BOLD|_ITALIC
         columns: Maximum columns per line
     """
     current_col = 0
 
-    for segment in segments:
-        content = segment["content"]
-        seg_type = segment["type"]
-
+    for seg_type, content in segments:
         if not content:
             continue
 
-        # Use regex to split but preserve all spacing
-        # This splits on spaces but keeps them as separate tokens
-        import re
-
-        tokens = re.split(r"(\s+)", content)
+        # Split on whitespace but keep it as separate tokens to preserve spacing
+        tokens = _WHITESPACE_SPLIT_RE.split(content)
 
         for token in tokens:
             if not token:
@@ -199,15 +237,16 @@ def _render_segments_with_wrapping(printer, segments: list, columns: int) -> Non
             if current_col == 0 and token.isspace():
                 continue
 
-            # Print token with appropriate formatting
-            if seg_type == "bold":
+            # Print token with appropriate formatting, undoing only the
+            # style that was switched on rather than resetting every mode
+            if seg_type == _BOLD:
                 printer.set(bold=True)
                 printer.text(token)
-                printer.set_with_default()
-            elif seg_type == "italic":
+                printer.set(bold=False)
+            elif seg_type == _ITALIC:
                 printer.set(underline=1)
                 printer.text(token)
-                printer.set_with_default()
+                printer.set(underline=0)
             else:
                 printer.text(token)
 
@@ -230,22 +269,25 @@ def _strip_inline_markdown(text: str) -> str:
     Used for headers since they're already styled prominently.
     """
     # Remove bold
-    text = re.sub(r"\*\*([^*]+?)\*\*", r"\1", text)
+    text = _BOLD_RE.sub(r"\1", text)
     # Remove italic (careful not to match bold remnants)
-    text = re.sub(r"(?<!\*)\*([^*]+?)\*(?!\*)", r"\1", text)
+    text = _ITALIC_RE.sub(r"\1", text)
     # Remove inline code
-    text = re.sub(r"`([^`]+?)`", r"\1", text)
+    text = _CODE_RE.sub(r"\1", text)
     # Remove links [text](url) → text
-    text = re.sub(r"\[([^\]]+?)\]\([^)]+?\)", r"\1", text)
+    text = _LINK_RE.sub(r"\1", text)
 
     return text
 
 
-def _parse_inline_formatting(text: str) -> list:
+@functools.lru_cache(maxsize=1024)
+def _parse_inline_formatting(text: str) -> tuple[tuple[int, str], ...]:
     """
     Parse inline markdown formatting into segments.
 
-    Returns list of dicts: [{'type': 'normal'|'bold'|'italic', 'content': 'text'}]
+    Results are cached, so segments are immutable tuples.
+
+    Returns tuple of (type, content) pairs, type is _NORMAL|_BOLD|_ITALIC
 
     Handles:
     - **bold**
@@ -254,31 +296,24 @@ def _parse_inline_formatting(text: str) -> list:
     segments = []
     current_pos = 0
 
-    # Pattern matches **bold** and *italic* (with word boundaries for italic)
-    # Bold: **text**
-    # Italic: *text* (but not mid-word like *something* in the middle)
-    pattern = r"(\*\*([^*]+?)\*\*)|(?<!\w)(\*([^*]+?)\*)(?!\w)"
-
-    for match in re.finditer(pattern, text):
+    for match in _INLINE_FORMAT_RE.finditer(text):
         # Add text before the match
         if match.start() > current_pos:
-            segments.append(
-                {"type": "normal", "content": text[current_pos : match.start()]}
-            )
+            segments.append((_NORMAL, text[current_pos : match.start()]))
 
         # Add the formatted text
         if match.group(1):  # **bold**
-            segments.append({"type": "bold", "content": match.group(2)})
+            segments.append((_BOLD, match.group(2)))
         elif match.group(3):  # *italic*
-            segments.append({"type": "italic", "content": match.group(4)})
+            segments.append((_ITALIC, match.group(4)))
 
         current_pos = match.end()
 
     # Add remaining text
     if current_pos < len(text):
-        segments.append({"type": "normal", "content": text[current_pos:]})
+        segments.append((_NORMAL, text[current_pos:]))
 
-    return segments if segments else [{"type": "normal", "content": text}]
+    return tuple(segments) if segments else ((_NORMAL, text),)
 
 
 def _render_text(printer, text: str, columns: int) -> None:
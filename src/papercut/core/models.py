@@ -3,16 +3,19 @@ Platform-agnostic ticket/issue models.
 These models work across Linear, Jira, GitHub Issues, etc.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime, date
 from typing import Optional, List
-from pydantic import BaseModel
 
 
-class Ticket(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Ticket:
     """
     Platform-agnostic ticket/issue model.
 
     This is the common format that all platform adapters convert to.
+    Adapters build it from already-validated platform payloads, so it is a
+    plain slotted dataclass rather than a validating model.
     """
 
     id: str
@@ -22,7 +25,7 @@ class Ticket(BaseModel):
     status: str
     priority: str
     assignee: Optional[str] = None
-    labels: List[str] = []
+    labels: List[str] = field(default_factory=list)
     created_at: datetime
     created_by: str
     team: str
@@ -3,18 +3,36 @@ Receipt printer output.
 Prints tickets on physical receipt printers using python-escpos.
 """
 
+import os
 import logging
-from escpos.printer import Usb
+import functools
+import textwrap
 from escpos.exceptions import USBNotFoundError, Error as EscposError
 from papercut.core.models import Ticket
-from papercut.core.utils import truncate_text, utc_to_local
-from config import config
+from papercut.core.utils import (
+    TIMESTAMP_FORMAT,
+    DATE_FORMAT,
+    SHORT_DATE_FORMAT,
+    format_date,
+    truncate_text,
+    utc_to_local,
+)
+from config import get_config
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _value_wrapper(width: int) -> textwrap.TextWrapper:
+    """Get the shared value-column wrapper for a column width."""
+    # Overlong words (URLs, IDs) stay whole on their own line, as before
+    return textwrap.TextWrapper(
+        width=width, break_long_words=False, break_on_hyphens=False
+    )
+
+
 def _format_receipt_line(
-    p: Usb,
+    max_col_count: int,
     label: str,
     value: str,
 ) -> str:
@@ -27,6 +45,7 @@ def _format_receipt_line(
     If the value is too long, it wraps to subsequent lines, right-aligned.
 
     Args:
+        max_col_count: Receipt width in characters (font A columns)
         label: The label text (e.g., "ID:", "Team:")
         value: The value text
 
@@ -34,49 +53,26 @@ def _format_receipt_line(
         Formatted string with proper spacing, possibly multi-line
     """
     # Maximum width for the value column (roughly half the receipt)
-    max_col_count = p.profile.get_columns(font="a")
     max_col_width = max_col_count // 2
 
     # If value fits on one line with the label
     if len(value) <= max_col_width:
-        spaces_needed = max_col_count - len(label) - len(value)
-        if spaces_needed < 1:
-            spaces_needed = 1
-        return f"{label}{' ' * spaces_needed}{value}\n"
-
-    # Value is too long - need to wrap it, right-aligned
-    lines = []
-    words = value.split()
-    current_line = []
-    current_length = 0
-
-    for word in words:
-        word_len = len(word) + (1 if current_line else 0)  # +1 for space between words
-        if current_length + word_len <= max_col_width:
-            current_line.append(word)
-            current_length += word_len
-        else:
-            if current_line:
-                lines.append(" ".join(current_line))
-            current_line = [word]
-            current_length = len(word)
+        # Right-align the value, keeping at least one space after the label
+        value_width = max(max_col_count - len(label), len(value) + 1)
+        return f"{label}{value:>{value_width}}\n"
 
-    if current_line:
-        lines.append(" ".join(current_line))
+    # Value is too long - need to wrap it, right-aligned. Runs of whitespace
+    # are collapsed first so wrapped lines only ever contain single spaces.
+    lines = _value_wrapper(max_col_width).wrap(" ".join(value.split()))
+    if not lines:
+        return ""
 
     # Format the output
-    result = []
-    for i, line in enumerate(lines):
-        if i == 0:
-            # First line includes the label
-            spaces_needed = max_col_count - len(label) - len(line)
-            if spaces_needed < 1:
-                spaces_needed = 1
-            result.append(f"{label}{' ' * spaces_needed}{line}\n")
-        else:
-            # Subsequent lines are right-aligned without label
-            spaces_needed = max_col_count - len(line)
-            result.append(f"{' ' * spaces_needed}{line}\n")
+    # First line includes the label; the rest are right-aligned without one
+    first = lines[0]
+    value_width = max(max_col_count - len(label), len(first) + 1)
+    result = [f"{label}{first:>{value_width}}\n"]
+    result += [f"{line:>{max_col_count}}\n" for line in lines[1:]]
 
     return "".join(result)
 
@@ -92,27 +88,57 @@ def _get_printer():
         USBNotFoundError: If USB printer not found
         EscposError: For other printer connection errors
     """
+    # escpos.printer pulls in the printer capability database, PIL and the
+    # USB/serial backends (a few hundred ms), so it's only imported when used
+    from escpos.printer import Usb
+
+    printer = get_config().printer
     try:
         logger.info(
-            f"Connecting to USB printer: vendor={hex(config.printer.usb_vendor_id)}, "
-            f"product={hex(config.printer.usb_product_id)}"
+            "Connecting to USB printer: vendor=%#x, product=%#x",
+            printer.usb_vendor_id,
+            printer.usb_product_id,
         )
         return Usb(
-            idVendor=config.printer.usb_vendor_id,
-            idProduct=config.printer.usb_product_id,
-            profile=config.printer.profile,
+            idVendor=printer.usb_vendor_id,
+            idProduct=printer.usb_product_id,
+            profile=printer.profile,
         )
 
     except USBNotFoundError as e:
         logger.error(
-            f"USB printer not found. Check vendor/product IDs and USB connection: {e}"
+            "USB printer not found. Check vendor/product IDs and USB connection: %s",
+            e,
         )
         raise
     except EscposError as e:
-        logger.error(f"Error connecting to printer: {e}")
+        logger.error("Error connecting to printer: %s", e)
         raise
 
 
+@functools.lru_cache(maxsize=4)
+def _render_logo(path: str, mtime_ns: int, profile: str) -> bytes:
+    """
+    Render the logo to ESC/POS raster bytes.
+
+    The logo only changes when its file does, so the decode and dithering
+    are done once per (path, mtime, profile) and replayed for every receipt.
+
+    Args:
+        path: Logo file path
+        mtime_ns: Logo file modification time, part of the cache key
+        profile: Printer profile the image is rendered for
+
+    Returns:
+        ESC/POS commands that print the centered logo
+    """
+    from escpos.printer import Dummy
+
+    p = Dummy(profile=profile)
+    p.image(path, center=True)
+    return p.output
+
+
 def _print_header(p) -> None:
     """
     Print receipt header (logo and company info).
@@ -120,43 +146,51 @@ def _print_header(p) -> None:
     Args:
         p: ESC/POS printer instance
     """
+    config = get_config()
+    header = config.header
 
     # Logo
-    if config.header.logo_path is not None:
+    if header.logo_path is not None:
         try:
-            p.image(config.header.logo_path, center=True)
+            # Rendered once per logo file version, then replayed as raw bytes
+            mtime_ns = os.stat(header.logo_path).st_mtime_ns
+            p._raw(_render_logo(header.logo_path, mtime_ns, config.printer.profile))
             p.ln()
         except Exception as e:
             logger.warning(
-                f"Failed to print logo '{config.header.logo_path}': {e}. "
+                "Failed to print logo '%s': %s. "
                 "Note: Only PNG, JPG, GIF, and BMP formats are supported. "
-                "SVG files must be converted to PNG first."
+                "SVG files must be converted to PNG first.",
+                header.logo_path,
+                e,
             )
 
     # Company name (large, bold)
-    if config.header.company_name is not None:
+    if header.company_name is not None:
         p.set(
             font="b", align="center", bold=True, double_height=True, double_width=True
         )
-        p.textln(config.header.company_name)
+        p.textln(header.company_name)
         p.ln()
 
     p.set_with_default(align="center")
 
-    # Address lines
-    if config.header.address_line1 is not None:
-        p.textln(config.header.address_line1)
-    if config.header.address_line2 is not None:
-        p.textln(config.header.address_line2)
-
-    # Contact info
-    if config.header.phone is not None:
-        p.textln(config.header.phone)
-    if config.header.url is not None:
-        p.textln(config.header.url)
+    # Address lines and contact info, sent as one block
+    contact = "".join(
+        f"{line}\n"
+        for line in (
+            header.address_line1,
+            header.address_line2,
+            header.phone,
+            header.url,
+        )
+        if line is not None
+    )
+    if contact:
+        p.text(contact)
 
+    # No trailing reset: the caller sets the style for the next block
     p.ln()
-    p.set_with_default()
 
 
 def _print_footer(p, url: str) -> None:
@@ -167,28 +201,122 @@ def _print_footer(p, url: str) -> None:
         p: ESC/POS printer instance
         url: URL to encode in QR code
     """
-    if config.footer.disabled:
+    footer = get_config().footer
+    if footer.disabled:
         return
 
     p.ln(2)
     p.set_with_default(align="center")
 
     # QR code title
-    if config.footer.qr_code_title is not None:
-        p.textln(config.footer.qr_code_title)
+    if footer.qr_code_title is not None:
+        p.textln(footer.qr_code_title)
 
     # QR code
-    if not config.footer.qr_code_disabled:
-        p.qr(url, size=config.footer.qr_code_size, native=True)
+    if not footer.qr_code_disabled:
+        p.qr(url, size=footer.qr_code_size, native=True)
         p.ln()
 
     # Footer text
-    if config.footer.footer_text is not None:
+    if footer.footer_text is not None:
         p.set(underline=True)
-        p.textln(config.footer.footer_text)
+        p.textln(footer.footer_text)
+
+
+def _render_receipt(ticket: Ticket) -> bytes:
+    """
+    Render a ticket receipt to raw ESC/POS bytes.
+
+    The receipt is drawn on an in-memory Dummy printer with the configured
+    profile, so it can be sent to the real printer in a single write.
+
+    Args:
+        ticket: The ticket to render
+
+    Returns:
+        ESC/POS command stream for the whole receipt
+    """
+    from escpos.printer import Dummy
+
+    config = get_config()
+    linear = config.providers.linear
+    p = Dummy(profile=config.printer.profile)
+
+    # Initialize printer to clean state
+    p.hw("INIT")
+
+    # Print header
+    _print_header(p)
+
+    # Timestamp
+    p.set_with_default(align="center")
+    p.textln(format_date(utc_to_local(ticket.created_at), TIMESTAMP_FORMAT))
 
     p.set_with_default()
 
+    # Column count is fixed by the profile; look it up once per receipt
+    columns = p.profile.get_columns(font="a")
+
+    # Ticket details (2-column layout: labels left, values right),
+    # gathered as (label, value) rows and written as one block
+    rows = [
+        ("ID:", ticket.identifier),
+        ("Team:", ticket.team),
+        ("Priority:", ticket.priority),
+        ("Status:", ticket.status),
+    ]
+
+    if ticket.project:
+        rows.append(("Project:", ticket.project))
+
+    if ticket.milestone:
+        if ticket.milestone_date:
+            milestone_date = format_date(ticket.milestone_date, SHORT_DATE_FORMAT)
+            rows.append(("Milestone:", f"{ticket.milestone} ({milestone_date})"))
+        else:
+            rows.append(("Milestone:", ticket.milestone))
+
+    if ticket.assignee:
+        rows.append(("Assignee:", ticket.assignee))
+
+    if ticket.due_date:
+        rows.append(("Due:", format_date(ticket.due_date, DATE_FORMAT)))
+
+    rows.append(("Creator:", ticket.created_by))
+
+    if ticket.labels:
+        rows.append(("Labels:", ", ".join(ticket.labels)))
+
+    p.text(
+        "".join(_format_receipt_line(columns, label, value) for label, value in rows)
+    )
+
+    # Title
+    p.ln()
+    p.set(font="b", bold=True, double_height=True, double_width=True)
+    title = truncate_text(ticket.title, linear.max_title_length)
+    # half the col count since font size is doubled
+    title_columns = p.profile.get_columns(font="b") // 2
+    p.block_text(title, columns=title_columns)
+
+    p.set_with_default()
+
+    # Description
+    if ticket.description:
+        p.ln(2)
+        from papercut.core.markdown import render_markdown_to_receipt
+
+        description = truncate_text(ticket.description, linear.max_description_length)
+        render_markdown_to_receipt(p, description)
+
+    # Print footer; its styles need no reset since the next receipt
+    # starts with INIT
+    _print_footer(p, ticket.url)
+
+    p.cut()
+
+    return p.output
+
 
 def print_to_printer(ticket: Ticket) -> None:
     """
@@ -212,86 +340,24 @@ def print_to_printer(ticket: Ticket) -> None:
     """
     p = None
     try:
-        p = _get_printer()
-
-        # Initialize printer to clean state
-        p.hw("INIT")
-
-        # Print header
-        _print_header(p)
-
-        # Timestamp
-        p.set_with_default(align="center")
-        p.textln(utc_to_local(ticket.created_at).strftime("%b %d, %Y at %I:%M %p"))
+        receipt = _render_receipt(ticket)
 
-        p.set_with_default()
-
-        # Ticket details (2-column layout: labels left, values right)
-        p.text(_format_receipt_line(p, "ID:", ticket.identifier))
-        p.text(_format_receipt_line(p, "Team:", ticket.team))
-        p.text(_format_receipt_line(p, "Priority:", ticket.priority))
-        p.text(_format_receipt_line(p, "Status:", ticket.status))
-
-        if ticket.project:
-            p.text(_format_receipt_line(p, "Project:", ticket.project))
-
-        if ticket.milestone:
-            milestone_text = ticket.milestone
-            if ticket.milestone_date:
-                milestone_text += f" ({ticket.milestone_date.strftime('%b %d')})"
-            p.text(_format_receipt_line(p, "Milestone:", milestone_text))
-
-        if ticket.assignee:
-            p.text(_format_receipt_line(p, "Assignee:", ticket.assignee))
-
-        if ticket.due_date:
-            p.text(
-                _format_receipt_line(p, "Due:", ticket.due_date.strftime("%b %d, %Y"))
-            )
-
-        p.text(_format_receipt_line(p, "Creator:", ticket.created_by))
-
-        if ticket.labels:
-            labels_text = ", ".join(ticket.labels)
-            p.text(_format_receipt_line(p, "Labels:", labels_text))
-
-        # Title
-        p.ln()
-        p.set(font="b", bold=True, double_height=True, double_width=True)
-        title = truncate_text(ticket.title, config.providers.linear.max_title_length)
-        # half the col count since font size is doubled
-        columns = p.profile.get_columns(font="b") // 2
-        p.block_text(title, columns=columns)
-
-        p.set_with_default()
-
-        # Description
-        if ticket.description:
-            p.ln(2)
-            from papercut.core.markdown import render_markdown_to_receipt
-
-            description = truncate_text(
-                ticket.description, config.providers.linear.max_description_length
-            )
-            render_markdown_to_receipt(p, description)
-
-        # Print footer
-        _print_footer(p, ticket.url)
-
-        p.cut()
+        # Send the whole receipt as one USB bulk write
+        p = _get_printer()
+        p._raw(receipt)
 
-        logger.info(f"Successfully printed ticket {ticket.identifier}")
+        logger.info("Successfully printed ticket %s", ticket.identifier)
 
     except USBNotFoundError:
         logger.error(
-            f"Failed to print ticket {ticket.identifier}: USB printer not found"
+            "Failed to print ticket %s: USB printer not found", ticket.identifier
         )
         raise
     except EscposError as e:
-        logger.error(f"Failed to print ticket {ticket.identifier}: {e}")
+        logger.error("Failed to print ticket %s: %s", ticket.identifier, e)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error printing ticket {ticket.identifier}: {e}")
+        logger.error("Unexpected error printing ticket %s: %s", ticket.identifier, e)
         raise
     finally:
         # Always close the printer connection to release the USB device
@@ -300,4 +366,4 @@ def print_to_printer(ticket: Ticket) -> None:
                 p.close()
                 logger.debug("Printer connection closed successfully")
             except Exception as e:
-                logger.warning(f"Error closing printer connection: {e}")
+                logger.warning("Error closing printer connection: %s", e)
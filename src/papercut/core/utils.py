@@ -3,8 +3,33 @@ Shared utility functions for the core package.
 Common text processing and formatting utilities.
 """
 
+import re
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+
+# Receipt date formats, shared by the console preview and the printer
+TIMESTAMP_FORMAT = "%b %d, %Y at %I:%M %p"
+DATE_FORMAT = "%b %d, %Y"
+SHORT_DATE_FORMAT = "%b %d"
+
+# Abbreviated month names as produced by %b in the C locale
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+# A run of non-whitespace characters
+_WORD = re.compile(r"\S+")
 
 
 def utc_to_local(utc_dt: datetime) -> datetime:
@@ -25,6 +50,55 @@ def utc_to_local(utc_dt: datetime) -> datetime:
     return utc_dt.astimezone()
 
 
+def _format_timestamp(value: datetime) -> str:
+    """Format as TIMESTAMP_FORMAT, e.g. "Jan 02, 2025 at 03:04 PM"."""
+    hour = value.hour
+    meridiem = "AM" if hour < 12 else "PM"
+    return (
+        f"{_MONTHS[value.month - 1]} {value.day:02d}, {value.year} "
+        f"at {hour % 12 or 12:02d}:{value.minute:02d} {meridiem}"
+    )
+
+
+def _format_date(value: date) -> str:
+    """Format as DATE_FORMAT, e.g. "Mar 09, 2025"."""
+    return f"{_MONTHS[value.month - 1]} {value.day:02d}, {value.year}"
+
+
+def _format_short_date(value: date) -> str:
+    """Format as SHORT_DATE_FORMAT, e.g. "Apr 01"."""
+    return f"{_MONTHS[value.month - 1]} {value.day:02d}"
+
+
+# Hand-written equivalents of the receipt formats above, used in place of
+# strftime (the app never changes locale, so month names are always English)
+_FIXED_FORMATTERS = {
+    TIMESTAMP_FORMAT: _format_timestamp,
+    DATE_FORMAT: _format_date,
+    SHORT_DATE_FORMAT: _format_short_date,
+}
+
+
+def format_date(value: date, fmt: str) -> str:
+    """
+    Format a date or datetime.
+
+    The receipt formats defined in this module are built directly with
+    f-strings; any other format falls back to strftime.
+
+    Args:
+        value: Date or datetime to format (datetimes should already be local)
+        fmt: strftime format string
+
+    Returns:
+        Formatted date string
+    """
+    formatter = _FIXED_FORMATTERS.get(fmt)
+    if formatter is not None:
+        return formatter(value)
+    return value.strftime(fmt)
+
+
 def normalize_optional_string(value: str | None) -> Optional[str]:
     """
     Convert empty strings to None for opt-out behavior.
@@ -33,11 +107,9 @@ def normalize_optional_string(value: str | None) -> Optional[str]:
         value: String value from config or input
 
     Returns:
-        None if value is empty string, otherwise the value as-is
+        None if value is None or an empty string, otherwise the value as-is
     """
-    if value == "":
-        return None
-    return value
+    return value or None
 
 
 def wrap_text(text: str, max_width: int) -> list[str]:
@@ -55,29 +127,36 @@ def wrap_text(text: str, max_width: int) -> list[str]:
         return [text]
 
     lines = []
-    words = text.split()
-    current_line = []
-    current_length = 0
-
-    for word in words:
-        word_len = len(word) + (1 if current_line else 0)  # +1 for space between words
-        if current_length + word_len <= max_width:
-            current_line.append(word)
-            current_length += word_len
+    # Current line as a span of the original text, so it can be sliced out
+    # in one go; `collapse` marks spans whose gaps aren't single spaces
+    line_start = line_end = None
+    line_length = 0
+    collapse = False
+
+    for word in _WORD.finditer(text):
+        start, end = word.span()
+        word_len = end - start
+        if line_start is not None:
+            if line_length + 1 + word_len <= max_width:
+                collapse = collapse or start - line_end != 1 or text[line_end] != " "
+                line_end = end
+                line_length += 1 + word_len
+                continue
+            line = text[line_start:line_end]
+            lines.append(" ".join(line.split()) if collapse else line)
+
+        # If single word is too long, force break it
+        if word_len > max_width:
+            lines.append(text[start : start + max_width])
+            line_start = None
         else:
-            if current_line:
-                lines.append(" ".join(current_line))
-            # If single word is too long, force break it
-            if len(word) > max_width:
-                lines.append(word[:max_width])
-                current_line = []
-                current_length = 0
-            else:
-                current_line = [word]
-                current_length = len(word)
-
-    if current_line:
-        lines.append(" ".join(current_line))
+            line_start, line_end = start, end
+            line_length = word_len
+            collapse = False
+
+    if line_start is not None:
+        line = text[line_start:line_end]
+        lines.append(" ".join(line.split()) if collapse else line)
 
     return lines
 
@@ -94,6 +173,6 @@ def truncate_text(text: str, max_length: int) -> str:
         Truncated text with '...' if exceeds max_length
     """
     text = text.strip()
-    if len(text) > max_length:
-        return text[: max_length - 3] + "..."
-    return text
+    if len(text) <= max_length:
+        return text
+    return f"{text[: max_length - 3]}..."
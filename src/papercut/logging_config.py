@@ -3,6 +3,7 @@ Logging configuration for Papercut.
 Configures structured logging for the application.
 """
 
+import copy
 import logging
 import sys
 
@@ -22,16 +23,35 @@ class ColoredFormatter(logging.Formatter):
     BOLD = "\033[1m"
     DIM = "\033[2m"
 
-    def format(self, record):
-        # Color the level name with colon and padding
-        levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}:{' ' * (8 - len(levelname))}{self.RESET}"
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The colored level prefixes never change, so build them once
+        self._levelnames = {
+            levelname: f"{color}{levelname}:{' ' * (8 - len(levelname))}{self.RESET}"
+            for levelname, color in self.COLORS.items()
+        }
+        # Dimmed logger names, built on first use (there are only a handful)
+        self._names = {}
+        # The format string is fixed, so whether it needs asctime is too
+        self._uses_time = super().usesTime()
+
+    def usesTime(self):
+        return self._uses_time
+
+    def formatMessage(self, record):
+        # Color a shallow copy of the record; the original is shared with
+        # other handlers and must keep its plain level and logger names
+        levelname = self._levelnames.get(record.levelname, record.levelname)
 
         # Dim the logger name
-        record.name = f"{self.DIM}{record.name}{self.RESET}"
+        name = self._names.get(record.name)
+        if name is None:
+            name = self._names[record.name] = f"{self.DIM}{record.name}{self.RESET}"
 
-        return super().format(record)
+        colored = copy.copy(record)
+        colored.levelname = levelname
+        colored.name = name
+        return self._style.format(colored)
 
 
 def setup_logging(level: str = "INFO") -> None:
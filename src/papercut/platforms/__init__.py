@@ -1,5 +1,6 @@
-"""Platform-specific webhook adapters and routers."""
+"""
+Platform-specific webhook adapters and routers.
 
-from papercut.platforms import linear
-
-__all__ = ["linear"]
+Each platform is an optional subpackage (e.g. papercut.platforms.linear) and
+is imported on demand, so a missing provider doesn't break the package.
+"""
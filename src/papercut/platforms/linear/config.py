@@ -7,8 +7,10 @@ from dataclasses import dataclass
 from typing import Optional
 from papercut.core.utils import normalize_optional_string as _normalize_optional_string
 
+_REQUIRED_KEYS = ("disabled", "max_title_length", "max_description_length")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LinearProviderConfig:
     """Linear provider configuration."""
 
@@ -60,20 +62,20 @@ def load_config_from_toml(toml_data: dict) -> LinearProviderConfig:
     providers_data = toml_data.get("providers", {})
     linear_data = providers_data.get("linear", {})
 
-    try:
-        config = LinearProviderConfig(
-            disabled=linear_data["disabled"],
-            signing_secret=_normalize_optional_string(
-                linear_data.get("signing_secret")
-            ),
-            max_title_length=linear_data["max_title_length"],
-            max_description_length=linear_data["max_description_length"],
-        )
-    except KeyError as e:
+    # Report every missing field at once rather than the first KeyError
+    missing = [key for key in _REQUIRED_KEYS if key not in linear_data]
+    if missing:
         raise ValueError(
-            f"Missing required Linear config field: {e}\n"
+            f"Missing required Linear config fields: {', '.join(missing)}\n"
             "Check [providers.linear] section in your config file"
-        ) from e
+        )
+
+    config = LinearProviderConfig(
+        disabled=linear_data["disabled"],
+        signing_secret=_normalize_optional_string(linear_data.get("signing_secret")),
+        max_title_length=linear_data["max_title_length"],
+        max_description_length=linear_data["max_description_length"],
+    )
 
     # Validate the loaded config
     validate_config(config)
@@ -3,27 +3,44 @@ Linear webhook router.
 Handles incoming Linear webhooks and processes Issue creation events.
 """
 
+import re
+import functools
 import hmac
 import hashlib
-import json
 import time
 import logging
-from typing import Optional
-from fastapi import APIRouter, Request, HTTPException
-from pydantic import BaseModel, Field
+import threading
+from typing import Annotated, Optional
+from fastapi import APIRouter, BackgroundTasks, Header, Request, HTTPException
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from papercut.core.models import Ticket
 from papercut.core.console import print_console_preview
 from papercut.core.printer import print_to_printer
 from papercut.platforms.linear.models import LinearWebhook
-from config import config
+from config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Linear issue payloads are a few KB; anything far larger is not a real webhook
+_MAX_BODY_BYTES = 1024 * 1024
+
+# Serializes receipts so concurrent webhooks don't interleave their output
+_print_lock = threading.Lock()
+
+# Accepted clock difference between Linear and us (60-second window)
+_MAX_WEBHOOK_AGE_MS = 60 * 1000
+
+# Linear sends the HMAC-SHA256 as 64 lower-case hex characters; anything
+# else (upper case, whitespace, wrong length) is rejected as malformed
+_SIGNATURE_RE = re.compile(r"[0-9a-f]{64}")
+
 
 class WebhookResponse(BaseModel):
     """Response from webhook endpoint"""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="Status of webhook processing")
     ignored: Optional[bool] = Field(None, description="Whether webhook was ignored")
     type: Optional[str] = Field(None, description="Event type")
@@ -31,6 +48,18 @@ class WebhookResponse(BaseModel):
     timestamp: Optional[int] = Field(None, description="Unix timestamp in milliseconds")
 
 
+# Every ignored webhook gets the same response; it's frozen, so share one
+_IGNORED_RESPONSE = WebhookResponse(status="received", ignored=True)
+
+
+class _WebhookEnvelope(BaseModel):
+    """Top-level webhook fields needed before validating the full payload."""
+
+    type: Optional[str] = None
+    action: Optional[str] = None
+    webhookTimestamp: Optional[int] = None
+
+
 class LinearAdapter:
     """Adapter to convert Linear webhooks to platform-agnostic Ticket model."""
 
@@ -46,6 +75,10 @@ class LinearAdapter:
             Ticket: Platform-agnostic ticket model
         """
         data = webhook.data
+        # Optional relations are each looked up once
+        assignee = data.assignee
+        project = data.project
+        milestone = data.milestone
         return Ticket(
             id=data.id,
             identifier=data.identifier,
@@ -53,34 +86,133 @@ class LinearAdapter:
             description=data.description,
             status=data.state.name,
             priority=data.priorityLabel,
-            assignee=data.assignee.name if data.assignee else None,
+            assignee=assignee.name if assignee else None,
             labels=[label.name for label in data.labels],
             created_at=data.createdAt,
             created_by=webhook.actor.name,
             team=data.team.name,
             due_date=data.dueDate,
             url=data.url,
-            project=data.project.name if data.project else None,
-            milestone=data.milestone.name if data.milestone else None,
-            milestone_date=data.milestone.targetDate if data.milestone else None,
+            project=project.name if project else None,
+            milestone=milestone.name if milestone else None,
+            milestone_date=milestone.targetDate if milestone else None,
         )
 
 
-def _verify_signature(payload_body: bytes, signature: str) -> bool:
-    """Verify HMAC-SHA256 signature from Linear."""
-    expected_signature = hmac.new(
-        config.providers.linear.signing_secret.encode("utf-8"),
-        payload_body,
-        hashlib.sha256,
-    ).hexdigest()
-    return hmac.compare_digest(expected_signature, signature)
+@functools.lru_cache(maxsize=1)
+def _hmac_template(signing_secret: str) -> hmac.HMAC:
+    """Build a keyed HMAC-SHA256 context to copy for each webhook."""
+    return hmac.new(signing_secret.encode("utf-8"), None, hashlib.sha256)
+
+
+async def _read_signed_body(request: Request) -> tuple[bytearray, bytes]:
+    """
+    Read the request body, computing its HMAC-SHA256 as chunks arrive.
+
+    Args:
+        request: Incoming webhook request
 
+    Returns:
+        Tuple of (raw body, HMAC-SHA256 digest of the body)
 
-def _verify_timestamp(webhook_timestamp: int, max_age_seconds: int = 60) -> bool:
+    Raises:
+        HTTPException: 413 if the body exceeds _MAX_BODY_BYTES
+    """
+    # Copying the keyed context skips re-encoding and re-padding the key
+    mac = _hmac_template(get_config().providers.linear.signing_secret).copy()
+    body = bytearray()
+    async for chunk in request.stream():
+        if len(body) + len(chunk) > _MAX_BODY_BYTES:
+            logger.warning("Webhook body too large - rejecting")
+            raise HTTPException(status_code=413, detail="Payload too large")
+        mac.update(chunk)
+        body += chunk
+    return body, mac.digest()
+
+
+def _decode_signature(signature: str) -> Optional[bytes]:
+    """
+    Decode the Linear-Signature header into a raw HMAC-SHA256 digest.
+
+    Args:
+        signature: Hex-encoded signature from the request header
+
+    Returns:
+        The 32-byte digest, or None if the header can't be a valid signature
+    """
+    if _SIGNATURE_RE.fullmatch(signature) is None:
+        return None
+    return bytes.fromhex(signature)
+
+
+def _verify_signature(digest: bytes, provided: bytes) -> bool:
+    """Verify HMAC-SHA256 signature from Linear against the body digest."""
+    return hmac.compare_digest(digest, provided)
+
+
+def _verify_timestamp(
+    webhook_timestamp: int, max_age_ms: int = _MAX_WEBHOOK_AGE_MS
+) -> bool:
     """Verify webhook timestamp to prevent replay attacks."""
-    current_time_ms = int(time.time() * 1000)
-    age_ms = abs(current_time_ms - webhook_timestamp)
-    return age_ms <= (max_age_seconds * 1000)
+    # Integer milliseconds straight from the clock, no float round-trip
+    current_time_ms = time.time_ns() // 1_000_000
+    return abs(current_time_ms - webhook_timestamp) <= max_age_ms
+
+
+def _print_ticket(ticket: Ticket) -> None:
+    """
+    Print a ticket to the console and the receipt printer.
+
+    Runs as a background task after the webhook response has been sent.
+
+    Args:
+        ticket: The ticket to print
+    """
+    with _print_lock:
+        try:
+            print_console_preview(ticket)
+            print_to_printer(ticket)
+        except Exception as e:
+            logger.error("Error printing ticket: %s", e)
+
+
+def _handle_issue_create(
+    payload_body: bytearray, background_tasks: BackgroundTasks
+) -> WebhookResponse:
+    """
+    Queue a receipt for a newly created issue.
+
+    Args:
+        payload_body: Raw, already verified webhook body
+        background_tasks: Tasks to run once the response has been sent
+
+    Returns:
+        WebhookResponse: Response to send back to Linear
+    """
+    # Parse and convert to platform-agnostic Ticket
+    try:
+        webhook = LinearWebhook.model_validate_json(payload_body)
+        ticket = LinearAdapter.to_ticket(webhook)
+    except Exception as e:
+        logger.info("Ignoring unparsable webhook: %s", e)
+        return _IGNORED_RESPONSE
+
+    # Print after responding so Linear gets its acknowledgement right away
+    background_tasks.add_task(_print_ticket, ticket)
+
+    return WebhookResponse(
+        status="received",
+        type=webhook.type,
+        action=webhook.action,
+        timestamp=webhook.webhookTimestamp,
+    )
+
+
+# Handlers by (type, action); only Issue creation events are processed
+_EVENT_HANDLERS = {
+    ("Issue", "create"): _handle_issue_create,
+}
+_HANDLED_EVENT_TYPES = frozenset(event_type for event_type, _ in _EVENT_HANDLERS)
 
 
 # Linear webhook router
@@ -88,7 +220,12 @@ router = APIRouter(tags=["Linear"])
 
 
 @router.post("/linear", response_model=WebhookResponse, summary="Linear Webhook")
-async def handle_webhook(request: Request) -> WebhookResponse:
+async def handle_webhook(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    signature: Annotated[Optional[str], Header(alias="Linear-Signature")] = None,
+    event_type: Annotated[Optional[str], Header(alias="Linear-Event")] = None,
+) -> WebhookResponse:
     """
     Handle Linear webhooks.
 
@@ -99,57 +236,47 @@ async def handle_webhook(request: Request) -> WebhookResponse:
     - Timestamp validation (60-second window)
     """
     # Verify signature
-    signature = request.headers.get("Linear-Signature")
     if not signature:
         raise HTTPException(status_code=401, detail="Missing Linear-Signature header")
 
-    payload_body = await request.body()
+    # Linear names the entity type in a header; events for other entities
+    # are discarded without side effects, so skip reading and verifying them
+    if event_type is not None and event_type not in _HANDLED_EVENT_TYPES:
+        logger.info("Ignoring webhook: %s", event_type)
+        return _IGNORED_RESPONSE
 
-    if not _verify_signature(payload_body, signature):
+    # A malformed signature can never match, so reject it before reading
+    # and hashing the body
+    provided = _decode_signature(signature)
+    if provided is None:
         logger.warning("Invalid signature - rejecting webhook")
         raise HTTPException(status_code=401, detail="Invalid signature")
 
-    # Parse JSON
+    payload_body, digest = await _read_signed_body(request)
+
+    if not _verify_signature(digest, provided):
+        logger.warning("Invalid signature - rejecting webhook")
+        raise HTTPException(status_code=401, detail="Invalid signature")
+
+    # Parse just the envelope fields straight from the raw bytes
     try:
-        payload_dict = json.loads(payload_body)
-    except json.JSONDecodeError as e:
-        logger.info(f"Ignoring malformed JSON: {e}")
-        return WebhookResponse(status="received", ignored=True)
+        envelope = _WebhookEnvelope.model_validate_json(payload_body)
+    except ValidationError as e:
+        logger.info("Ignoring malformed JSON: %s", e)
+        return _IGNORED_RESPONSE
 
     # Verify timestamp
-    webhook_timestamp = payload_dict.get("webhookTimestamp")
+    webhook_timestamp = envelope.webhookTimestamp
     if webhook_timestamp and not _verify_timestamp(webhook_timestamp):
         logger.warning("Webhook timestamp too old - rejecting to prevent replay attack")
         raise HTTPException(
             status_code=401, detail="Webhook timestamp outside acceptable range"
         )
 
-    # Only process Issue creation events
-    webhook_type = payload_dict.get("type")
-    webhook_action = payload_dict.get("action")
-
-    if webhook_type != "Issue" or webhook_action != "create":
-        logger.info(f"Ignoring webhook: {webhook_type}:{webhook_action}")
-        return WebhookResponse(status="received", ignored=True)
+    # Dispatch on event type; anything without a handler is acknowledged
+    handler = _EVENT_HANDLERS.get((envelope.type, envelope.action))
+    if handler is None:
+        logger.info("Ignoring webhook: %s:%s", envelope.type, envelope.action)
+        return _IGNORED_RESPONSE
 
-    # Parse and convert to platform-agnostic Ticket
-    try:
-        webhook = LinearWebhook(**payload_dict)
-        ticket = LinearAdapter.to_ticket(webhook)
-    except Exception as e:
-        logger.info(f"Ignoring unparsable webhook: {e}")
-        return WebhookResponse(status="received", ignored=True)
-
-    # Print the ticket
-    try:
-        print_console_preview(ticket)
-        print_to_printer(ticket)
-    except Exception as e:
-        logger.error(f"Error printing ticket: {e}")
-
-    return WebhookResponse(
-        status="received",
-        type=webhook.type,
-        action=webhook.action,
-        timestamp=webhook.webhookTimestamp,
-    )
+    return handler(payload_body, background_tasks)